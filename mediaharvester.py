@@ -4,16 +4,28 @@ Media Harvester
 Double-click to run. Downloads media from urls.txt.
 """
 
+import functools
+import http.client
+import importlib
+import io
 import os
 import platform
 import re
 import shutil
+import site
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 # ANSI color codes
 class Colors:
@@ -42,35 +54,97 @@ LOGO = f"""
 ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝  ╚═══╝  ╚══════╝╚══════╝   ╚═╝   ╚══════╝╚═╝  ╚═╝{Colors.RESET}
 """
 
-# URL patterns that yt-dlp can handle
+# URL shape that yt-dlp can handle: http(s) scheme followed by a dotted host.
+# Known sites (youtube.com, youtu.be, vimeo.com, ...) are all matched by the
+# host check, so no per-site alternation is needed. Matching is split into
+# two patterns without nested or overlapping quantifiers so it stays linear.
 URL_PATTERN = re.compile(
-    r'^https?://'  # http:// or https://
-    r'(?:www\.)?'  # optional www.
-    r'(?:'
-    r'youtube\.com/(?:watch\?v=|shorts/|playlist\?list=|embed/|v/)'
-    r'|youtu\.be/'
-    r'|vimeo\.com/'
-    r'|dailymotion\.com/'
-    r'|twitter\.com/.*/status/'
-    r'|x\.com/.*/status/'
-    r'|tiktok\.com/'
-    r'|instagram\.com/'
-    r'|facebook\.com/'
-    r'|twitch\.tv/'
-    r'|soundcloud\.com/'
-    r'|reddit\.com/'
-    r'|[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'  # Generic domain fallback
-    r')',
-    re.IGNORECASE
+    r'\Ahttps?://'  # http:// or https://
+    r'([a-z0-9.-]{1,253})',  # host (www. included)
+    re.IGNORECASE | re.ASCII
 )
 
+# A dot followed by a TLD of at least two letters, searched within the host
+TLD_PATTERN = re.compile(r'\.[a-z]{2}', re.IGNORECASE | re.ASCII)
+
+# Keywords in yt-dlp error messages that map to a friendlier explanation
+ERROR_KEYWORD_PATTERN = re.compile(r'ffmpeg|merge|private|age|sign in|available', re.IGNORECASE)
+
+# Options for metadata-only extraction (validation). Extraction settings
+# match the download options so cached info can be reused for downloading.
+PROBE_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    'noplaylist': True,
+    'nocheckcertificate': True,
+    'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+}
+
+# Extracted metadata by URL, shared between validation and downloads
+INFO_CACHE: dict[str, dict] = {}
+
+# Number of URLs probed concurrently during validation
+VALIDATE_WORKERS = 8
+
+# Number of URLs downloaded concurrently
+DOWNLOAD_WORKERS = 4
+
+# Serializes console output from download worker threads
+OUTPUT_LOCK = threading.Lock()
+
+# Set when the user interrupts a download batch; running downloads abort
+# from progress_hook and workers stop picking up new URLs
+CANCEL_DOWNLOADS = threading.Event()
+
+# Static parts of the progress line, formatted once
+PROGRESS_PREFIX = f"\r        {Colors.YELLOW}"
+PROGRESS_SEPARATOR = f"{Colors.RESET} at {Colors.CYAN}"
+PROGRESS_SUFFIX = f"{Colors.RESET}  "
+PROGRESS_DONE = f"\r        {Colors.GREEN}Done!{Colors.RESET}                    \n"
+
+# Minimum seconds between flushes of the progress line
+PROGRESS_FLUSH_INTERVAL = 0.1
+last_progress_flush = 0.0
+
+# Host OS as reported by platform.system() ("Darwin", "Windows", "Linux")
+SYSTEM = platform.system()
+
+# Windows clears with `cls`, which also enables ANSI colors in the console.
+# Elsewhere the screen is cleared with an escape sequence, without a subprocess.
+CLEAR_COMMAND = 'cls' if os.name == 'nt' else None
+CLEAR_SEQUENCE = '\033[H\033[2J\033[3J'  # home, clear screen, clear scrollback
+
+# yt-dlp module and its DownloadError, bound once by load_yt_dlp()
+yt_dlp = None
+DownloadError = None
+
+# Directory containing this script (bin/, urls.txt, video/, audio/ live here)
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# Downloaded archives up to this size are kept in memory, larger ones go to
+# an anonymous temporary file
+ARCHIVE_SPOOL_SIZE = 64 * 1024 * 1024
+
+# Redirects followed on a shared keep-alive connection before handing off to urllib
+MAX_REDIRECTS = 5
+
+
+def load_yt_dlp() -> None:
+    """Import yt-dlp and bind it at module level. Raises ImportError if missing."""
+    global yt_dlp, DownloadError
+    import yt_dlp as module
+    yt_dlp = module
+    DownloadError = module.utils.DownloadError
+
 
 def install_dependencies() -> bool:
     """Install required packages if missing (yt-dlp and FFmpeg)."""
     # Install yt-dlp
     yt_dlp_ok = False
     try:
-        import yt_dlp  # noqa: F401
+        load_yt_dlp()
         yt_dlp_ok = True
     except ImportError:
         print("First run - installing dependencies...")
@@ -91,7 +165,7 @@ def install_dependencies() -> bool:
 
         for cmd, method in install_commands:
             try:
-                subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                run_command(cmd, quiet=True)
                 print(f"  yt-dlp installed (via {method})")
                 yt_dlp_ok = True
                 break
@@ -101,19 +175,28 @@ def install_dependencies() -> bool:
         if not yt_dlp_ok:
             print(f"{Colors.RED}Error: Failed to auto-install yt-dlp.{Colors.RESET}")
             print(f"\n{Colors.YELLOW}Please install manually using one of these methods:{Colors.RESET}")
-            if platform.system() == "Darwin":
+            if SYSTEM == "Darwin":
                 print("\n  Option 1 (recommended for Mac):")
                 print("    brew install yt-dlp")
                 print("\n  Option 2:")
                 print("    pipx install yt-dlp")
                 print("\n  Option 3:")
                 print("    pip3 install --user --break-system-packages yt-dlp")
-            elif platform.system() == "Windows":
+            elif SYSTEM == "Windows":
                 print("    pip install yt-dlp")
             else:
                 print("    pip3 install --user yt-dlp")
             return False
 
+        # Make the fresh install importable without restarting
+        importlib.invalidate_caches()
+        site.addsitedir(site.getusersitepackages())
+        try:
+            load_yt_dlp()
+        except ImportError:
+            print(f"{Colors.YELLOW}yt-dlp was installed but can't be loaded yet. Please run Media Harvester again.{Colors.RESET}")
+            return False
+
     # Install FFmpeg
     if not check_ffmpeg():
         print("  Installing FFmpeg...")
@@ -125,47 +208,112 @@ def install_dependencies() -> bool:
 
 def get_script_dir() -> Path:
     """Return the directory containing this script."""
-    return Path(__file__).parent.resolve()
+    return SCRIPT_DIR
 
 
-def check_ffmpeg() -> bool:
-    """Check if ffmpeg is available in PATH or local bin directory."""
-    script_dir = get_script_dir()
-    local_ffmpeg = script_dir / "bin" / "ffmpeg"
+@functools.lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """Resolve a program name to an absolute path (looked up once per name)."""
+    return shutil.which(name)
+
+
+def run_command(cmd: list[str], quiet: bool = False) -> None:
+    """Run a command and raise CalledProcessError if it fails.
+
+    The program is resolved to an absolute path and close_fds is left off
+    (Python's own fds are non-inheritable anyway), which lets CPython start
+    the child with posix_spawn instead of fork+exec.
+    """
+    program = cmd[0] if os.path.isabs(cmd[0]) else find_executable(cmd[0])
+    if program is None:
+        raise FileNotFoundError(f"{cmd[0]} not found")
+
+    output = subprocess.DEVNULL if quiet else None
+    subprocess.check_call([program, *cmd[1:]], stdout=output, stderr=output, close_fds=False)
+
+
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg() -> Optional[str]:
+    """Locate ffmpeg, checking the local bin directory before PATH.
+
+    The result is cached; install_ffmpeg and uninstall_dependencies clear it.
+    """
+    local_ffmpeg = SCRIPT_DIR / "bin" / "ffmpeg"
 
     # Check local bin first
     if local_ffmpeg.exists():
-        return True
+        return str(local_ffmpeg)
 
     # Check system PATH
-    return shutil.which("ffmpeg") is not None
+    return shutil.which("ffmpeg")
+
+
+def check_ffmpeg() -> bool:
+    """Check if ffmpeg is available in PATH or local bin directory."""
+    return find_ffmpeg() is not None
 
 
 def get_ffmpeg_path() -> Optional[str]:
     """Get the path to ffmpeg executable."""
-    script_dir = get_script_dir()
-    local_ffmpeg = script_dir / "bin" / "ffmpeg"
+    return find_ffmpeg()
 
-    if local_ffmpeg.exists():
-        return str(local_ffmpeg)
 
-    return shutil.which("ffmpeg")
+def download_archive(url: str, connection: Optional[http.client.HTTPSConnection] = None) -> BinaryIO:
+    """Download a zip archive into a seekable buffer, rewound for reading.
+
+    If a connection is given, the request and any same-host redirects are
+    sent over it, so consecutive downloads share one TLS session. Uses
+    BytesIO or TemporaryFile rather than SpooledTemporaryFile, which lacks
+    seekable() (needed by ZipFile) before Python 3.11.
+    """
+    response = None
+    for _ in range(MAX_REDIRECTS if connection is not None else 0):
+        parts = urllib.parse.urlsplit(url)
+        if (parts.scheme, parts.hostname, parts.port or 443) != ("https", connection.host, connection.port):
+            break
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        connection.request("GET", path, headers={"User-Agent": "mediaharvester"})
+        reply = connection.getresponse()
+        if reply.status not in (301, 302, 303, 307, 308):
+            if reply.status != 200:
+                reply.read()
+                raise urllib.error.HTTPError(url, reply.status, reply.reason, reply.headers, None)
+            response = reply
+            break
+        reply.read()  # Drain so the connection can be reused
+        url = urllib.parse.urljoin(url, reply.getheader("Location", ""))
+
+    if response is None:
+        # No shared connection, off-host redirect, or too many redirects
+        response = urllib.request.urlopen(url)
+
+    with response:
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) <= ARCHIVE_SPOOL_SIZE:
+            buffer = io.BytesIO()
+        else:
+            buffer = tempfile.TemporaryFile()
+        shutil.copyfileobj(response, buffer, 1 << 20)
+    buffer.seek(0)
+    return buffer
 
 
 def install_ffmpeg() -> bool:
     """Install ffmpeg based on the current platform."""
-    system = platform.system()
     script_dir = get_script_dir()
     bin_dir = script_dir / "bin"
 
+    # Whatever happens below may change where ffmpeg is found
+    find_ffmpeg.cache_clear()
+
     print("\nInstalling FFmpeg...")
 
-    if system == "Darwin":  # macOS
+    if SYSTEM == "Darwin":  # macOS
         # Check for Homebrew first
-        if shutil.which("brew"):
+        if find_executable("brew"):
             print("Found Homebrew. Installing ffmpeg via brew...")
             try:
-                subprocess.check_call(["brew", "install", "ffmpeg"])
+                run_command(["brew", "install", "ffmpeg"])
                 print("FFmpeg installed successfully!")
                 return True
             except subprocess.CalledProcessError:
@@ -180,20 +328,30 @@ def install_ffmpeg() -> bool:
             ffmpeg_url = "https://evermeet.cx/ffmpeg/getrelease/ffmpeg/zip"
             ffprobe_url = "https://evermeet.cx/ffmpeg/getrelease/ffprobe/zip"
 
-            for name, url in [("ffmpeg", ffmpeg_url), ("ffprobe", ffprobe_url)]:
-                zip_path = bin_dir / f"{name}.zip"
-                print(f"  Downloading {name}...")
-                urllib.request.urlretrieve(url, zip_path)
-
-                with zipfile.ZipFile(zip_path, 'r') as zf:
+            def extract(archive: BinaryIO, name: str) -> None:
+                with archive, zipfile.ZipFile(archive, 'r') as zf:
                     zf.extractall(bin_dir)
 
-                zip_path.unlink()
-
                 # Make executable
                 binary = bin_dir / name
                 binary.chmod(0o755)
 
+            # Both archives come from the same host: download them over one
+            # keep-alive connection, extracting each in the background while
+            # the next one downloads
+            connection = http.client.HTTPSConnection("evermeet.cx")
+            try:
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    extractions = []
+                    for name, url in [("ffmpeg", ffmpeg_url), ("ffprobe", ffprobe_url)]:
+                        print(f"  Downloading {name}...")
+                        archive = download_archive(url, connection)
+                        extractions.append(pool.submit(extract, archive, name))
+                    for extraction in extractions:
+                        extraction.result()
+            finally:
+                connection.close()
+
             print(f"FFmpeg installed to: {bin_dir}")
             return True
         except Exception as e:
@@ -203,7 +361,7 @@ def install_ffmpeg() -> bool:
             print("  - Then run: brew install ffmpeg")
             return False
 
-    elif system == "Windows":
+    elif SYSTEM == "Windows":
         print("Downloading FFmpeg for Windows...")
         try:
             bin_dir.mkdir(parents=True, exist_ok=True)
@@ -211,22 +369,24 @@ def install_ffmpeg() -> bool:
             # gyan.dev provides trusted Windows ffmpeg builds
             # Using essentials build (smaller) from GitHub releases
             ffmpeg_url = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
-            zip_path = bin_dir / "ffmpeg.zip"
 
             print("  Downloading (this may take a moment)...")
-            urllib.request.urlretrieve(ffmpeg_url, zip_path)
+            archive = download_archive(ffmpeg_url)
 
             print("  Extracting...")
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Find the bin folder in the archive
-                for member in zf.namelist():
-                    if member.endswith('/bin/ffmpeg.exe') or member.endswith('/bin/ffprobe.exe'):
-                        # Extract to bin_dir with just the filename
-                        filename = Path(member).name
-                        with zf.open(member) as source, open(bin_dir / filename, 'wb') as target:
-                            target.write(source.read())
-
-            zip_path.unlink()
+            with archive, zipfile.ZipFile(archive, 'r') as zf:
+                # Find the binaries in the archive's bin folder
+                members = [
+                    member for member in zf.namelist()
+                    if member.endswith(('/bin/ffmpeg.exe', '/bin/ffprobe.exe'))
+                ]
+                for member in members:
+                    # Extract to bin_dir with just the filename, streaming in
+                    # chunks rather than reading each binary into memory
+                    filename = Path(member).name
+                    with zf.open(member) as source, open(bin_dir / filename, 'wb') as target:
+                        shutil.copyfileobj(source, target, 1 << 20)
+
             print(f"FFmpeg installed to: {bin_dir}")
             return True
         except Exception as e:
@@ -264,13 +424,9 @@ def uninstall_dependencies() -> None:
         if confirm == 'y':
             print("Uninstalling yt-dlp...")
             try:
-                subprocess.check_call(
-                    [sys.executable, "-m", "pip", "uninstall", "-y", "yt-dlp"],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+                run_command([sys.executable, "-m", "pip", "uninstall", "-y", "yt-dlp"], quiet=True)
                 print("yt-dlp uninstalled.")
-            except subprocess.CalledProcessError:
+            except (subprocess.CalledProcessError, FileNotFoundError):
                 print("Failed to uninstall yt-dlp.")
 
     if choice in ("2", "3"):
@@ -282,15 +438,15 @@ def uninstall_dependencies() -> None:
             if confirm == 'y':
                 try:
                     shutil.rmtree(bin_dir)
+                    find_ffmpeg.cache_clear()
                     print("Local FFmpeg removed.")
                 except Exception as e:
                     print(f"Failed to remove: {e}")
         else:
             print("No local FFmpeg installation found.")
-            system = platform.system()
-            if system == "Darwin" and shutil.which("brew"):
+            if SYSTEM == "Darwin" and find_executable("brew"):
                 print("To uninstall system FFmpeg: brew uninstall ffmpeg")
-            elif system == "Windows":
+            elif SYSTEM == "Windows":
                 print("To uninstall system FFmpeg: winget uninstall ffmpeg")
 
     wait_for_enter()
@@ -309,10 +465,16 @@ def create_urls_file(file_path: Path) -> None:
 
 
 def is_valid_url_format(url: str) -> bool:
-    """Check if a string looks like a valid URL format."""
-    if not url or not url.strip():
+    """Check if an already-stripped string looks like a valid URL format."""
+    # Cheap prefilter before the regex: every valid URL starts with "http"
+    # (in any case), so most junk lines are rejected on the first character
+    if not url or url[0] not in 'hH':
         return False
-    return bool(URL_PATTERN.match(url.strip()))
+    match = URL_PATTERN.match(url)
+    if match is None:
+        return False
+    # Search from index 1: the host needs a label before the TLD
+    return TLD_PATTERN.search(match.group(1), 1) is not None
 
 
 def load_urls(file_path: Path) -> Optional[dict[str, list[str]]]:
@@ -328,31 +490,40 @@ def load_urls(file_path: Path) -> Optional[dict[str, list[str]]]:
     current_folder = ""  # Empty string = root downloads folder
     skipped_lines: list[tuple[int, str]] = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line:
-                continue
-
+    # Scan raw bytes: comment/header checks are ASCII, so only lines that
+    # are kept need decoding
+    data = file_path.read_bytes()
+    for line_num, raw_line in enumerate(data.splitlines(), start=1):
+        line = raw_line.strip()
+        # bytes.strip() only removes ASCII whitespace, while str.strip() also
+        # removes \x1c-\x1f and Unicode spaces (e.g. no-break space). Strip
+        # as str when such a character could be left at either end.
+        if line and (line[0] < 0x20 or line[-1] < 0x20 or not line.isascii()):
+            line = line.decode('utf-8').strip().encode('utf-8')
+        if not line:
+            continue
+
+        # Comments and headers start with \ or #; URL lines skip both checks
+        if line[0] in b'#\\':
             # Skip comment lines (start with \\)
-            if line.startswith('\\\\'):
+            if line.startswith(b'\\\\'):
                 continue
 
             # Check if this is a folder header (# followed by text)
-            if line.startswith('# '):
-                folder_name = line[2:].strip()
+            if line.startswith(b'# '):
+                folder_name = line[2:].decode('utf-8').strip()
                 if folder_name:
                     current_folder = folder_name
                 continue
 
-            # Validate URL format before adding
-            if not is_valid_url_format(line):
-                skipped_lines.append((line_num, line))
-                continue
+        url = line.decode('utf-8')
+
+        # Validate URL format before adding
+        if not is_valid_url_format(url):
+            skipped_lines.append((line_num, url))
+            continue
 
-            if current_folder not in folders:
-                folders[current_folder] = []
-            folders[current_folder].append(line)
+        folders.setdefault(current_folder, []).append(url)
 
     # Report skipped lines
     if skipped_lines:
@@ -366,138 +537,265 @@ def load_urls(file_path: Path) -> Optional[dict[str, list[str]]]:
     return folders if folders else None
 
 
+def get_info(ydl, url: str) -> dict:
+    """Extract info for a URL, reusing metadata fetched earlier in this session."""
+    info = INFO_CACHE.get(url)
+    if info is None:
+        info = ydl.extract_info(url, download=False)
+        INFO_CACHE[url] = info
+    return info
+
+
 def validate_urls(url_dict: dict[str, list[str]]) -> tuple[dict, dict]:
-    """Validate all URLs and return valid/invalid dicts by folder."""
-    import yt_dlp
+    """Validate all URLs and return valid/invalid dicts by folder.
 
+    URLs are probed concurrently; each worker thread reuses its own YoutubeDL.
+    """
     valid: dict[str, list[str]] = {}
     invalid: dict[str, list[str]] = {}
-    total = sum(len(urls) for urls in url_dict.values())
+    jobs = [(folder, url) for folder, urls in url_dict.items() for url in urls]
+    total = len(jobs)
 
     print(f"\n{Colors.BOLD}Validating {total} URL(s)...{Colors.RESET}\n")
 
-    count = 0
-    for folder, urls in url_dict.items():
-        folder_display = folder if folder else "(root)"
-
-        for url in urls:
-            count += 1
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'skip_download': True,
-                'nocheckcertificate': True,
-            }
+    local = threading.local()
+    lock = threading.Lock()
 
+    with ExitStack() as stack:
+        def probe(url: str) -> tuple[bool, Optional[str]]:
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                with lock:
+                    ydl = stack.enter_context(yt_dlp.YoutubeDL(PROBE_OPTS))
+                local.ydl = ydl
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'Unknown Title')
-                    print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {Colors.GREEN}{title}{Colors.RESET}")
-                    if folder not in valid:
-                        valid[folder] = []
-                    valid[folder].append(url)
+                info = get_info(ydl, url)
+                return True, info.get('title', 'Unknown Title')
             except Exception:
-                print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {Colors.RED}Invalid URL{Colors.RESET}")
-                if folder not in invalid:
-                    invalid[folder] = []
-                invalid[folder].append(url)
+                return False, None
+
+        with ThreadPoolExecutor(max_workers=min(VALIDATE_WORKERS, total) or 1) as pool:
+            futures = [pool.submit(probe, url) for _, url in jobs]
+
+            # Report in submission order so output matches urls.txt
+            try:
+                for count, ((folder, url), future) in enumerate(zip(jobs, futures), start=1):
+                    ok, title = future.result()
+                    folder_display = folder if folder else "(root)"
+                    if ok:
+                        print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {Colors.GREEN}{title}{Colors.RESET}")
+                        if folder not in valid:
+                            valid[folder] = []
+                        valid[folder].append(url)
+                    else:
+                        print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {Colors.RED}Invalid URL{Colors.RESET}")
+                        if folder not in invalid:
+                            invalid[folder] = []
+                        invalid[folder].append(url)
+            except BaseException:
+                # Don't let shutdown run every queued probe (e.g. on Ctrl+C)
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
 
     return valid, invalid
 
 
 def progress_hook(d: dict) -> None:
-    """Display download progress."""
+    """Display download progress.
+
+    yt-dlp calls this many times per second, so updates are written to the
+    stdout buffer and only flushed every PROGRESS_FLUSH_INTERVAL seconds.
+    """
+    global last_progress_flush
+
+    # Raising from a hook aborts the download inside yt-dlp
+    if CANCEL_DOWNLOADS.is_set():
+        raise KeyboardInterrupt
+
     if d['status'] == 'downloading':
         percent = d.get('_percent_str', '???%').strip()
         speed = d.get('_speed_str', '???').strip()
-        print(f"\r        {Colors.YELLOW}{percent}{Colors.RESET} at {Colors.CYAN}{speed}{Colors.RESET}  ", end='', flush=True)
+        line = ''.join((PROGRESS_PREFIX, percent, PROGRESS_SEPARATOR, speed, PROGRESS_SUFFIX))
+        with OUTPUT_LOCK:
+            sys.stdout.write(line)
+            now = time.monotonic()
+            if now - last_progress_flush >= PROGRESS_FLUSH_INTERVAL:
+                sys.stdout.flush()
+                last_progress_flush = now
     elif d['status'] == 'finished':
-        print(f"\r        {Colors.GREEN}Done!{Colors.RESET}                    ")
+        with OUTPUT_LOCK:
+            sys.stdout.write(PROGRESS_DONE)
+            sys.stdout.flush()
+
+
+# yt-dlp options shared by every download; download_url sets 'outtmpl' per URL
+VIDEO_OPTS = {
+    'format': 'bestvideo[vcodec^=avc1][ext=mp4]+bestaudio[ext=m4a]/bestvideo[vcodec^=avc1]+bestaudio/best[vcodec^=avc1]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    'merge_output_format': 'mp4',
+    'windowsfilenames': True,
+    'restrictfilenames': True,
+    'quiet': True,
+    'no_warnings': True,
+    'noprogress': True,
+    'noplaylist': True,
+    'nocheckcertificate': True,
+    'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+    'progress_hooks': [progress_hook],
+    'postprocessor_args': {
+        'merger': ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23', '-c:a', 'aac', '-movflags', '+faststart'],
+    },
+    'ignoreerrors': False,
+    'retries': 3,
+}
+
+AUDIO_OPTS = {
+    'format': 'bestaudio/best',
+    'windowsfilenames': True,
+    'restrictfilenames': True,
+    'quiet': True,
+    'no_warnings': True,
+    'noprogress': True,
+    'noplaylist': True,
+    'nocheckcertificate': True,
+    'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
+    'progress_hooks': [progress_hook],
+    'postprocessors': [{
+        'key': 'FFmpegExtractAudio',
+        'preferredcodec': 'mp3',
+        'preferredquality': '192',
+    }],
+    'ignoreerrors': False,
+    'retries': 3,
+}
+
+
+def print_line(message: str) -> None:
+    """Print a full line from a download worker, replacing any progress line."""
+    with OUTPUT_LOCK:
+        print(f"\r\033[K{message}")
+
+
+def download_url(ydl, count: int, total: int, folder: str, folder_dir: str, url: str,
+                 ffmpeg_keywords: tuple[str, ...], ffmpeg_hint: str) -> bool:
+    """Download a single URL with the given YoutubeDL. Returns True on success."""
+    folder_display = folder if folder else "(root)"
+    ydl.params['outtmpl'] = {'default': f'{folder_dir}{os.sep}{count} - %(title).80s [%(id)s].%(ext)s'}
+
+    # Extract once (or reuse validation results): the same info is used
+    # for the title and the download
+    info = None
+    extract_error: Optional[Exception] = None
+    try:
+        info = get_info(ydl, url)
+        title = info.get('title', 'Unknown')
+    except Exception as e:
+        title = "Unknown"
+        extract_error = e
 
+    print_line(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {title}")
 
-def download_videos(url_dict: dict[str, list[str]], output_dir: Path) -> tuple[int, int]:
-    """Download videos from URLs, organized by folder."""
-    import yt_dlp
+    try:
+        if extract_error is not None:
+            raise extract_error
+        try:
+            # Copy so the cached entry isn't modified by the download
+            ydl.process_ie_result(dict(info), download=True)
+        except (DownloadError, yt_dlp.utils.ReExtractInfo, yt_dlp.utils.UnavailableVideoError):
+            # Cached info may be stale (e.g. expired format URLs). As in
+            # yt-dlp's download_with_info_file, retry once from the URL;
+            # download() also handles re-extraction and error reporting.
+            INFO_CACHE.pop(url, None)
+            ydl.download([url])
+        return True
+    except DownloadError as e:
+        error_msg = str(e)
+        lines = [f"        {Colors.RED}Download failed [{count}/{total}]:{Colors.RESET}"]
+        # Show helpful context based on error type (one scan of the message)
+        keywords = {keyword.lower() for keyword in ERROR_KEYWORD_PATTERN.findall(error_msg)}
+        if keywords.intersection(ffmpeg_keywords):
+            lines.append(f"        {Colors.YELLOW}{ffmpeg_hint}{Colors.RESET}")
+            lines.append(f"        {Colors.YELLOW}Install it via menu option 4.{Colors.RESET}")
+        elif "private" in keywords:
+            lines.append(f"        {Colors.YELLOW}This video is private.{Colors.RESET}")
+        elif "age" in keywords or "sign in" in keywords:
+            lines.append(f"        {Colors.YELLOW}This video requires age verification/login.{Colors.RESET}")
+        elif "available" in keywords:
+            lines.append(f"        {Colors.YELLOW}Video unavailable (deleted or region-locked).{Colors.RESET}")
+        else:
+            lines.append(f"        {Colors.DIM}{error_msg[:200]}{Colors.RESET}")
+        print_line("\n".join(lines))
+        return False
+    except Exception as e:
+        print_line(f"        {Colors.RED}Error [{count}/{total}]: {type(e).__name__}: {e}{Colors.RESET}")
+        return False
+
+
+def download_batch(url_dict: dict[str, list[str]], output_dir: Path, ydl_opts: dict,
+                   ffmpeg_keywords: tuple[str, ...], ffmpeg_hint: str) -> tuple[int, int]:
+    """Download all URLs on a bounded worker pool. Returns (success, failed)."""
+    # Create every output folder once, before any worker starts. Paths are
+    # kept as strings since they only feed yt-dlp's output template.
+    folder_dirs = {folder: os.fspath(output_dir / folder if folder else output_dir) for folder in url_dict}
+    for folder_dir in set(folder_dirs.values()):
+        os.makedirs(folder_dir, exist_ok=True)
+
+    # Number URLs up front so filenames don't depend on completion order
+    flat_urls = ((folder, url) for folder, urls in url_dict.items() for url in urls)
+    jobs = [(count, folder, folder_dirs[folder], url) for count, (folder, url) in enumerate(flat_urls, start=1)]
+    total = len(jobs)
+
+    local = threading.local()
+    lock = threading.Lock()
+    CANCEL_DOWNLOADS.clear()
+
+    with ExitStack() as stack:
+        def worker(job: tuple[int, str, str, str]) -> bool:
+            if CANCEL_DOWNLOADS.is_set():
+                raise KeyboardInterrupt
+            # One YoutubeDL per thread, each with its own copy of the options
+            # since the output template is changed per URL
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                with lock:
+                    ydl = stack.enter_context(yt_dlp.YoutubeDL(dict(ydl_opts)))
+                local.ydl = ydl
+            count, folder, folder_dir, url = job
+            return download_url(ydl, count, total, folder, folder_dir, url, ffmpeg_keywords, ffmpeg_hint)
+
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, total) or 1) as pool:
+            futures = [pool.submit(worker, job) for job in jobs]
+            try:
+                results = [future.result() for future in futures]
+            except BaseException:
+                # Abort running downloads and drop queued ones (e.g. on Ctrl+C)
+                CANCEL_DOWNLOADS.set()
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    success_count = sum(results)
+    return success_count, total - success_count
 
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    success_count = 0
-    fail_count = 0
+def download_videos(url_dict: dict[str, list[str]], output_dir: Path) -> tuple[int, int]:
+    """Download videos from URLs, organized by folder."""
     total = sum(len(urls) for urls in url_dict.values())
 
     print(f"\n{Colors.BOLD}Downloading {total} video(s)...{Colors.RESET}\n")
 
     # Get ffmpeg path for merging video+audio streams
     ffmpeg_path = get_ffmpeg_path()
-    ffmpeg_location = str(Path(ffmpeg_path).parent) if ffmpeg_path else None
+    ffmpeg_location = os.path.dirname(ffmpeg_path) if ffmpeg_path else None
 
-    count = 0
-    for folder, urls in url_dict.items():
-        folder_dir = output_dir / folder if folder else output_dir
-        folder_display = folder if folder else "(root)"
-        folder_dir.mkdir(parents=True, exist_ok=True)
+    ydl_opts = VIDEO_OPTS.copy()
 
-        for url in urls:
-            count += 1
+    if ffmpeg_location:
+        ydl_opts['ffmpeg_location'] = ffmpeg_location
 
-            # Get video title
-            try:
-                with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'nocheckcertificate': True}) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'Unknown')
-            except Exception:
-                title = "Unknown"
-
-            print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {title}")
-
-            ydl_opts = {
-                'format': 'bestvideo[vcodec^=avc1][ext=mp4]+bestaudio[ext=m4a]/bestvideo[vcodec^=avc1]+bestaudio/best[vcodec^=avc1]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-                'merge_output_format': 'mp4',
-                'outtmpl': str(folder_dir / f'{count} - %(title).80s [%(id)s].%(ext)s'),
-                'windowsfilenames': True,
-                'restrictfilenames': True,
-                'quiet': True,
-                'no_warnings': True,
-                'noprogress': True,
-                'noplaylist': True,
-                'nocheckcertificate': True,
-                'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
-                'progress_hooks': [progress_hook],
-                'postprocessor_args': {
-                    'merger': ['-c:v', 'libx264', '-preset', 'medium', '-crf', '23', '-c:a', 'aac', '-movflags', '+faststart'],
-                },
-                'ignoreerrors': False,
-                'retries': 3,
-            }
-
-            if ffmpeg_location:
-                ydl_opts['ffmpeg_location'] = ffmpeg_location
-
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                    success_count += 1
-            except yt_dlp.utils.DownloadError as e:
-                error_msg = str(e)
-                print(f"        {Colors.RED}Download failed:{Colors.RESET}")
-                # Show helpful context based on error type
-                if "ffmpeg" in error_msg.lower() or "merge" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}FFmpeg is required to merge video+audio.{Colors.RESET}")
-                    print(f"        {Colors.YELLOW}Install it via menu option 4.{Colors.RESET}")
-                elif "private" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}This video is private.{Colors.RESET}")
-                elif "age" in error_msg.lower() or "sign in" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}This video requires age verification/login.{Colors.RESET}")
-                elif "available" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}Video unavailable (deleted or region-locked).{Colors.RESET}")
-                else:
-                    print(f"        {Colors.DIM}{error_msg[:200]}{Colors.RESET}")
-                fail_count += 1
-            except Exception as e:
-                print(f"        {Colors.RED}Error: {type(e).__name__}: {e}{Colors.RESET}")
-                fail_count += 1
+    success_count, fail_count = download_batch(
+        url_dict, output_dir, ydl_opts,
+        ffmpeg_keywords=("ffmpeg", "merge"),
+        ffmpeg_hint="FFmpeg is required to merge video+audio.",
+    )
 
     print()
     return success_count, fail_count
@@ -505,85 +803,24 @@ def download_videos(url_dict: dict[str, list[str]], output_dir: Path) -> tuple[i
 
 def download_audio(url_dict: dict[str, list[str]], output_dir: Path) -> tuple[int, int]:
     """Download audio as MP3 from URLs, organized by folder."""
-    import yt_dlp
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    success_count = 0
-    fail_count = 0
     total = sum(len(urls) for urls in url_dict.values())
 
     print(f"\n{Colors.BOLD}Downloading {total} audio file(s)...{Colors.RESET}\n")
 
     # Get ffmpeg path for yt-dlp
     ffmpeg_path = get_ffmpeg_path()
-    ffmpeg_location = str(Path(ffmpeg_path).parent) if ffmpeg_path else None
+    ffmpeg_location = os.path.dirname(ffmpeg_path) if ffmpeg_path else None
 
-    count = 0
-    for folder, urls in url_dict.items():
-        folder_dir = output_dir / folder if folder else output_dir
-        folder_display = folder if folder else "(root)"
-        folder_dir.mkdir(parents=True, exist_ok=True)
+    ydl_opts = AUDIO_OPTS.copy()
 
-        for url in urls:
-            count += 1
+    if ffmpeg_location:
+        ydl_opts['ffmpeg_location'] = ffmpeg_location
 
-            # Get video title
-            try:
-                with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'nocheckcertificate': True}) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'Unknown')
-            except Exception:
-                title = "Unknown"
-
-            print(f"{Colors.DIM}[{count}/{total}]{Colors.RESET} {Colors.CYAN}[{folder_display}]{Colors.RESET} {title}")
-
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': str(folder_dir / f'{count} - %(title).80s [%(id)s].%(ext)s'),
-                'windowsfilenames': True,
-                'restrictfilenames': True,
-                'quiet': True,
-                'no_warnings': True,
-                'noprogress': True,
-                'noplaylist': True,
-                'nocheckcertificate': True,
-                'extractor_args': {'youtube': {'player_client': ['android', 'web']}},
-                'progress_hooks': [progress_hook],
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
-                'ignoreerrors': False,
-                'retries': 3,
-            }
-
-            if ffmpeg_location:
-                ydl_opts['ffmpeg_location'] = ffmpeg_location
-
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([url])
-                    success_count += 1
-            except yt_dlp.utils.DownloadError as e:
-                error_msg = str(e)
-                print(f"        {Colors.RED}Download failed:{Colors.RESET}")
-                if "ffmpeg" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}FFmpeg is required for MP3 conversion.{Colors.RESET}")
-                    print(f"        {Colors.YELLOW}Install it via menu option 4.{Colors.RESET}")
-                elif "private" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}This video is private.{Colors.RESET}")
-                elif "age" in error_msg.lower() or "sign in" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}This video requires age verification/login.{Colors.RESET}")
-                elif "available" in error_msg.lower():
-                    print(f"        {Colors.YELLOW}Video unavailable (deleted or region-locked).{Colors.RESET}")
-                else:
-                    print(f"        {Colors.DIM}{error_msg[:200]}{Colors.RESET}")
-                fail_count += 1
-            except Exception as e:
-                print(f"        {Colors.RED}Error: {type(e).__name__}: {e}{Colors.RESET}")
-                fail_count += 1
+    success_count, fail_count = download_batch(
+        url_dict, output_dir, ydl_opts,
+        ffmpeg_keywords=("ffmpeg",),
+        ffmpeg_hint="FFmpeg is required for MP3 conversion.",
+    )
 
     print()
     return success_count, fail_count
@@ -591,7 +828,11 @@ def download_audio(url_dict: dict[str, list[str]], output_dir: Path) -> tuple[in
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if CLEAR_COMMAND:
+        os.system(CLEAR_COMMAND)
+    else:
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
 
 def wait_for_enter() -> None:
@@ -601,22 +842,23 @@ def wait_for_enter() -> None:
 
 def get_menu_choice(url_count: int, folder_count: int) -> str:
     """Get validated menu choice from user."""
-    while True:
-        clear_screen()
-        print(LOGO)
-        if folder_count:
-            print(f"{Colors.DIM}Found {Colors.YELLOW}{url_count}{Colors.RESET}{Colors.DIM} URL(s) in {Colors.YELLOW}{folder_count}{Colors.RESET}{Colors.DIM} folder(s){Colors.RESET}\n")
-        else:
-            print(f"{Colors.DIM}Found {Colors.YELLOW}{url_count}{Colors.RESET}{Colors.DIM} URL(s) in urls.txt{Colors.RESET}\n")
-
-        print(f"{Colors.BOLD}What would you like to do?{Colors.RESET}")
-        print(f"  {Colors.CYAN}1.{Colors.RESET} Validate URLs")
-        print(f"  {Colors.CYAN}2.{Colors.RESET} Download all videos")
-        print(f"  {Colors.CYAN}3.{Colors.RESET} Download as MP3")
-        print(f"  {Colors.CYAN}4.{Colors.RESET} Uninstall dependencies")
-        print(f"  {Colors.CYAN}5.{Colors.RESET} Exit")
-        print()
+    clear_screen()
+    print(LOGO)
+    if folder_count:
+        print(f"{Colors.DIM}Found {Colors.YELLOW}{url_count}{Colors.RESET}{Colors.DIM} URL(s) in {Colors.YELLOW}{folder_count}{Colors.RESET}{Colors.DIM} folder(s){Colors.RESET}\n")
+    else:
+        print(f"{Colors.DIM}Found {Colors.YELLOW}{url_count}{Colors.RESET}{Colors.DIM} URL(s) in urls.txt{Colors.RESET}\n")
+
+    print(f"{Colors.BOLD}What would you like to do?{Colors.RESET}")
+    print(f"  {Colors.CYAN}1.{Colors.RESET} Validate URLs")
+    print(f"  {Colors.CYAN}2.{Colors.RESET} Download all videos")
+    print(f"  {Colors.CYAN}3.{Colors.RESET} Download as MP3")
+    print(f"  {Colors.CYAN}4.{Colors.RESET} Uninstall dependencies")
+    print(f"  {Colors.CYAN}5.{Colors.RESET} Exit")
+    print()
 
+    # The menu stays on screen; only re-prompt on invalid input
+    while True:
         choice = input(f"{Colors.YELLOW}Enter choice (1-5): {Colors.RESET}").strip()
 
         if choice in ('1', '2', '3', '4', '5'):